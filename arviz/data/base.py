@@ -1,9 +1,10 @@
 """Low level converters usually used by other functions."""
-from copy import deepcopy
 from typing import Dict, List, Any
 import datetime
+import functools
 import warnings
 import pkg_resources
+import numpy as np
 import xarray as xr
 
 from .. import utils
@@ -22,7 +23,7 @@ class requires:  # pylint: disable=invalid-name
     """
 
     def __init__(self, *props):
-        self.props = props
+        self.props = tuple((prop,) if isinstance(prop, str) else tuple(prop) for prop in props)
 
     def __call__(self, func):  # noqa: D202
         """Wrap the decorated function."""
@@ -30,8 +31,7 @@ class requires:  # pylint: disable=invalid-name
         def wrapped(cls, *args, **kwargs):
             """Return None if not all props are available."""
             for prop in self.props:
-                prop = [prop] if isinstance(prop, str) else prop
-                if all([getattr(cls, prop_i) is None for prop_i in prop]):
+                if all(getattr(cls, prop_i, None) is None for prop_i in prop):
                     return None
             return func(cls, *args, **kwargs)
 
@@ -70,7 +70,8 @@ def generate_dims_coords(shape, var_name, dims=None, coords=None, default_dims=N
         default_dims = []
     if dims is None:
         dims = []
-    if len([dim for dim in dims if dim not in default_dims]) > len(shape):
+    default_dims_set = set(default_dims)
+    if sum(dim not in default_dims_set for dim in dims) > len(shape):
         warnings.warn(
             (
                 "In variable {var_name}, there are "
@@ -84,23 +85,20 @@ def generate_dims_coords(shape, var_name, dims=None, coords=None, default_dims=N
             ),
             SyntaxWarning,
         )
-    if coords is None:
-        coords = {}
-
-    coords = deepcopy(coords)
-    dims = deepcopy(dims)
-
-    for idx, dim_len in enumerate(shape):
-        if (len(dims) < idx + 1) or (dims[idx] is None):
-            dim_name = "{var_name}_dim_{idx}".format(var_name=var_name, idx=idx)
-            if len(dims) < idx + 1:
-                dims.append(dim_name)
-            else:
-                dims[idx] = dim_name
-        dim_name = dims[idx]
+    # only the containers are modified below, the coordinate values are never
+    # touched in place, so shallow copies are enough
+    coords = {} if coords is None else dict(coords)
+    dims = list(dims)
+    dims += [None] * (len(shape) - len(dims))
+    dims = [
+        "{}_dim_{}".format(var_name, idx) if dim is None else dim for idx, dim in enumerate(dims)
+    ]
+
+    for dim_name, dim_len in zip(dims, shape):
         if dim_name not in coords:
             coords[dim_name] = utils.arange(dim_len)
-    coords = {key: coord for key, coord in coords.items() if any(key == dim for dim in dims)}
+    dims_set = set(dims)
+    coords = {key: coord for key, coord in coords.items() if key in dims_set}
     return dims, coords
 
 
@@ -132,9 +130,19 @@ def numpy_to_data_array(ary, *, var_name="data", coords=None, dims=None):
     xr.DataArray
         Will have the same data as passed, but with coordinates and dimensions
     """
+    return _numpy_to_data_array(ary, var_name=var_name, coords=coords, dims=dims, index_cache={})
+
+
+def _numpy_to_data_array(ary, *, var_name, coords, dims, index_cache):
+    """Convert a numpy array to an xarray.DataArray, see ``numpy_to_data_array``.
+
+    ``index_cache`` maps ``(dim, size)`` to the default chain and draw index variables
+    already built, so that several variables converted together can share them.
+    """
     # manage and transform copies
     default_dims = ["chain", "draw"]
-    ary = utils.two_de(ary)
+    if not isinstance(ary, np.ndarray) or ary.ndim < 2:
+        ary = utils.two_de(ary)
     n_chains, n_samples, *shape = ary.shape
     if n_chains > n_samples:
         warnings.warn(
@@ -155,16 +163,74 @@ def numpy_to_data_array(ary, *, var_name="data", coords=None, dims=None):
     if "chain" not in dims:
         dims = ["chain"] + dims
 
-    if "chain" not in coords:
-        coords["chain"] = utils.arange(n_chains)
-    if "draw" not in coords:
-        coords["draw"] = utils.arange(n_samples)
+    index_vars = {}
+    for key, size in (("chain", n_chains), ("draw", n_samples)):
+        if key in coords:
+            continue
+        if (key, size) not in index_cache:
+            index_cache[key, size] = xr.IndexVariable((key,), utils.arange(size))
+        index_vars[key] = index_cache[key, size]
 
     # filter coords based on the dims
-    coords = {key: xr.IndexVariable((key,), data=coords[key]) for key in dims}
+    coords = {
+        key: index_vars[key] if key in index_vars else xr.IndexVariable((key,), data=coords[key])
+        for key in dims
+    }
     return xr.DataArray(ary, coords=coords, dims=dims)
 
 
+def _shared_dims_data_vars(data, coords, dims):
+    """Build Dataset data_vars and coords directly when all variables share chain and draw.
+
+    1d arrays are interpreted as a single chain, like in ``numpy_to_data_array``. Returns
+    None if the variables can not be safely combined without alignment, in which case each
+    variable has to be converted on its own with ``numpy_to_data_array``.
+    """
+    default_dims = ["chain", "draw"]
+    if not data or not all(
+        isinstance(values, np.ndarray) and values.ndim >= 1 for values in data.values()
+    ):
+        return None
+    data = {key: utils.two_de(values) for key, values in data.items()}
+    n_chains, n_samples = next(iter(data.values())).shape[:2]
+    if any(values.shape[:2] != (n_chains, n_samples) for values in data.values()):
+        return None
+
+    dim_sizes = {"chain": n_chains, "draw": n_samples}
+    data_vars = {}
+    dataset_coords = {}
+    for key, values in data.items():
+        var_dims = dims.get(key)
+        if var_dims is not None and any(dim in default_dims for dim in var_dims):
+            return None
+        var_dims, var_coords = generate_dims_coords(
+            values.shape[2:], key, dims=var_dims, coords=coords, default_dims=default_dims
+        )
+        if len(var_dims) != values.ndim - 2:
+            return None
+        for dim, dim_len in zip(var_dims, values.shape[2:]):
+            # the same dim with different lengths needs alignment
+            if dim_sizes.setdefault(dim, dim_len) != dim_len:
+                return None
+        dataset_coords.update(var_coords)
+        data_vars[key] = (default_dims + var_dims, values)
+
+    if n_chains > n_samples:
+        warnings.warn(
+            "More chains ({n_chains}) than draws ({n_samples}). "
+            "Passed array should have shape (chains, draws, *shape)".format(
+                n_chains=n_chains, n_samples=n_samples
+            ),
+            SyntaxWarning,
+        )
+    dataset_coords["chain"] = utils.arange(n_chains)
+    dataset_coords["draw"] = utils.arange(n_samples)
+    # a variable named like a dim of another one is dropped by the Dataset merge
+    if not dataset_coords.keys().isdisjoint(data_vars):
+        return None
+    return data_vars, dataset_coords
+
+
 def dict_to_dataset(data, *, attrs=None, library=None, coords=None, dims=None):
     """Convert a dictionary of numpy arrays to an xarray.Dataset.
 
@@ -194,14 +260,35 @@ def dict_to_dataset(data, *, attrs=None, library=None, coords=None, dims=None):
     if dims is None:
         dims = {}
 
+    # common case of all variables sharing chain and draw, build the Dataset in one go
+    shared = _shared_dims_data_vars(data, coords, dims)
+    if shared is not None:
+        data_vars, dataset_coords = shared
+        return xr.Dataset(
+            data_vars=data_vars,
+            coords=dataset_coords,
+            attrs=make_attrs(attrs=attrs, library=library),
+        )
+
+    # default chain and draw index variables are shared by variables of the same sizes
+    index_cache = {}
     data_vars = {}
     for key, values in data.items():
-        data_vars[key] = numpy_to_data_array(
-            values, var_name=key, coords=coords, dims=dims.get(key)
+        data_vars[key] = _numpy_to_data_array(
+            values, var_name=key, coords=coords, dims=dims.get(key), index_cache=index_cache
         )
     return xr.Dataset(data_vars=data_vars, attrs=make_attrs(attrs=attrs, library=library))
 
 
+@functools.lru_cache(maxsize=None)
+def _library_version(library_name):
+    """Get the installed version of a library, cached to avoid repeated metadata lookups."""
+    try:
+        return pkg_resources.get_distribution(library_name).version
+    except pkg_resources.DistributionNotFound:
+        return None
+
+
 def make_attrs(attrs=None, library=None):
     """Make standard attributes to attach to xarray datasets.
 
@@ -219,13 +306,11 @@ def make_attrs(attrs=None, library=None):
     if library is not None:
         library_name = library.__name__
         default_attrs["inference_library"] = library_name
-        try:
-            version = pkg_resources.get_distribution(library_name).version
+        version = _library_version(library_name)
+        if version is not None:
             default_attrs["inference_library_version"] = version
-        except pkg_resources.DistributionNotFound:
-            if hasattr(library, "__version__"):
-                version = library.__version__
-                default_attrs["inference_library_version"] = version
+        elif hasattr(library, "__version__"):
+            default_attrs["inference_library_version"] = library.__version__
 
     if attrs is not None:
         default_attrs.update(attrs)
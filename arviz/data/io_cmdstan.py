@@ -180,8 +180,8 @@ class CmdStanConverter:
         dtypes = {"divergent__": bool, "n_leapfrog__": np.int64, "treedepth__": np.int64}
 
         # copy dims and coords
-        dims = deepcopy(self.dims) if self.dims is not None else {}
-        coords = deepcopy(self.coords) if self.coords is not None else {}
+        dims = dict(self.dims) if self.dims is not None else {}
+        coords = dict(self.coords) if self.coords is not None else {}
 
         sampler_params = self.sample_stats
         log_likelihood = self.log_likelihood
@@ -289,8 +289,8 @@ class CmdStanConverter:
         dtypes = {"divergent__": bool, "n_leapfrog__": np.int64, "treedepth__": np.int64}
 
         # copy dims and coords
-        dims = deepcopy(self.dims) if self.dims is not None else {}
-        coords = deepcopy(self.coords) if self.coords is not None else {}
+        dims = dict(self.dims) if self.dims is not None else {}
+        coords = dict(self.coords) if self.coords is not None else {}
 
         sampler_params = self.sample_stats_prior
         for j, s_params in enumerate(sampler_params):
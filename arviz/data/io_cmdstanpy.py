@@ -1,6 +1,5 @@
 """CmdStanPy-specific conversion code."""
 from collections import defaultdict
-from copy import deepcopy
 import logging
 import re
 
@@ -88,8 +87,8 @@ class CmdStanPyConverter:
         columns = self.posterior.column_names
         valid_cols = [col for col in columns if col.endswith("__")]
         # copy dims and coords
-        dims = deepcopy(self.dims) if self.dims is not None else {}
-        coords = deepcopy(self.coords) if self.coords is not None else {}
+        dims = dict(self.dims) if self.dims is not None else {}
+        coords = dict(self.coords) if self.coords is not None else {}
 
         log_likelihood = self.log_likelihood
         if isinstance(log_likelihood, str):
@@ -167,8 +166,8 @@ class CmdStanPyConverter:
         columns = self.prior.column_names
         valid_cols = [col for col in columns if col.endswith("__")]
         # copy dims and coords
-        dims = deepcopy(self.dims) if self.dims is not None else {}
-        coords = deepcopy(self.coords) if self.coords is not None else {}
+        dims = dict(self.dims) if self.dims is not None else {}
+        coords = dict(self.coords) if self.coords is not None else {}
 
         data = _unpack_frame(self.prior.sample, columns, valid_cols)
         for s_param in list(data.keys()):
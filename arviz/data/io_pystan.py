@@ -1,6 +1,5 @@
 """PyStan-specific conversion code."""
 from collections import OrderedDict
-from copy import deepcopy
 import re
 
 import numpy as np
@@ -68,8 +67,8 @@ class PyStanConverter:
         posterior = self.posterior
 
         # copy dims and coords
-        dims = deepcopy(self.dims) if self.dims is not None else {}
-        coords = deepcopy(self.coords) if self.coords is not None else {}
+        dims = dict(self.dims) if self.dims is not None else {}
+        coords = dict(self.coords) if self.coords is not None else {}
 
         # log_likelihood
         log_likelihood = self.log_likelihood
@@ -235,8 +234,8 @@ class PyStan3Converter:
         posterior = self.posterior
         posterior_model = self.posterior_model
         # copy dims and coords
-        dims = deepcopy(self.dims) if self.dims is not None else {}
-        coords = deepcopy(self.coords) if self.coords is not None else {}
+        dims = dict(self.dims) if self.dims is not None else {}
+        coords = dict(self.coords) if self.coords is not None else {}
 
         # log_likelihood
         log_likelihood = self.log_likelihood
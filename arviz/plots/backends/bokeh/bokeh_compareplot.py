@@ -1,4 +1,5 @@
 """Bokeh Compareplot."""
+import numpy as np
 import bokeh.plotting as bkp
 from bokeh.models import Span
 
@@ -37,34 +38,29 @@ def _compareplot(
             width=figsize[0] * 90, height=figsize[1] * 90, output_backend="webgl", tools=tools
         )
 
-    yticks_pos = list(yticks_pos)
+    ic_vals = comp_df[information_criterion].values
 
     if plot_ic_diff:
         yticks_labels[0] = comp_df.index[0]
-        yticks_labels[2::2] = comp_df.index[1:]
+        yticks_labels[2::2] = comp_df.index.values[1:]
 
         ax.yaxis.ticker = yticks_pos
         ax.yaxis.major_label_overrides = {
-            dtype(key): value
-            for key, value in zip(yticks_pos, yticks_labels)
-            for dtype in (int, float)
-            if (dtype(key) - key == 0)
+            int(key) if key.is_integer() else key: value
+            for key, value in zip(yticks_pos.tolist(), yticks_labels)
         }
 
         # create the coordinates for the errorbars
-        err_xs = []
-        err_ys = []
-
-        for x, y, xerr in zip(
-            comp_df[information_criterion].iloc[1:], yticks_pos[1::2], comp_df.dse[1:]
-        ):
-            err_xs.append((x - xerr, x + xerr))
-            err_ys.append((y, y))
+        ic_diff = ic_vals[1:]
+        dse = comp_df.dse.values[1:]
+        ypos = yticks_pos[1::2]
+        err_xs = np.stack([ic_diff - dse, ic_diff + dse], axis=1).tolist()
+        err_ys = np.stack([ypos, ypos], axis=1).tolist()
 
         # plot them
         ax.triangle(
-            comp_df[information_criterion].iloc[1:],
-            yticks_pos[1::2],
+            ic_diff,
+            ypos,
             line_color=plot_kwargs.get("color_dse", "grey"),
             fill_color=plot_kwargs.get("color_dse", "grey"),
             line_width=2,
@@ -80,7 +76,7 @@ def _compareplot(
         }
 
     ax.circle(
-        comp_df[information_criterion],
+        ic_vals,
         yticks_pos[::2],
         line_color=plot_kwargs.get("color_ic", "black"),
         fill_color=None,
@@ -90,19 +86,17 @@ def _compareplot(
 
     if plot_standard_error:
         # create the coordinates for the errorbars
-        err_xs = []
-        err_ys = []
-
-        for x, y, xerr in zip(comp_df[information_criterion], yticks_pos[::2], comp_df.se):
-            err_xs.append((x - xerr, x + xerr))
-            err_ys.append((y, y))
+        se = comp_df.se.values
+        ypos = yticks_pos[::2]
+        err_xs = np.stack([ic_vals - se, ic_vals + se], axis=1).tolist()
+        err_ys = np.stack([ypos, ypos], axis=1).tolist()
 
         # plot them
         ax.multi_line(err_xs, err_ys, line_color=plot_kwargs.get("color_ic", "black"))
 
     if insample_dev:
         ax.circle(
-            comp_df[information_criterion] - (2 * comp_df["p_" + information_criterion]),
+            ic_vals - (2 * comp_df["p_" + information_criterion].values),
             yticks_pos[::2],
             line_color=plot_kwargs.get("color_insample_dev", "black"),
             fill_color=plot_kwargs.get("color_insample_dev", "black"),
@@ -111,7 +105,7 @@ def _compareplot(
         )
 
     vline = Span(
-        location=comp_df[information_criterion].iloc[0],
+        location=ic_vals[0],
         dimension="height",
         line_color=plot_kwargs.get("color_ls_min_ic", "grey"),
         line_width=line_width,
@@ -143,7 +143,7 @@ def _plot_trace_bokeh(
     if lines is None:
         lines = ()
 
-    num_colors = len(data.chain) + 1 if combined else len(data.chain)
+    num_colors = data.sizes["chain"] + 1 if combined else data.sizes["chain"]
     colors = [
         prop
         for _, prop in zip(
@@ -24,7 +24,7 @@ def _compareplot(
 
     if plot_ic_diff:
         yticks_labels[0] = comp_df.index[0]
-        yticks_labels[2::2] = comp_df.index[1:]
+        yticks_labels[2::2] = comp_df.index.values[1:]
         ax.set_yticks(yticks_pos)
         ax.errorbar(
             x=comp_df[information_criterion].iloc[1:],
@@ -90,21 +90,19 @@ def plot_compare(
     yticks_pos, step = np.linspace(0, -1, (comp_df.shape[0] * 2) - 1, retstep=True)
     yticks_pos[1::2] = yticks_pos[1::2] + step / 2
 
-    yticks_labels = [""] * len(yticks_pos)
+    yticks_labels = np.full(len(yticks_pos), "", dtype=object)
 
     _information_criterion = ["waic", "loo"]
-    column_index = [c.lower() for c in comp_df.columns]
-    for information_criterion in _information_criterion:
-        if information_criterion in column_index:
-            break
-    else:
+    column_index = {c.lower() for c in comp_df.columns}
+    information_criterion = next((ic for ic in _information_criterion if ic in column_index), None)
+    if information_criterion is None:
         raise ValueError(
             "comp_df must contain one of the following"
             " information criterion: {}".format(_information_criterion)
         )
 
     if order_by_rank:
-        comp_df.sort_values(by="rank", inplace=True)
+        comp_df = comp_df.iloc[comp_df["rank"].values.argsort(kind="stable")]
 
     compareplot_kwargs = dict(
         ax=ax,
@@ -128,7 +128,7 @@ def plot_rank(
     else:
         figsize, ax_labelsize, titlesize, _, _, _ = _scale_fig_size(figsize, None)
 
-    chains = len(posterior_data.chain)
+    chains = posterior_data.sizes["chain"]
     if colors == "cycle":
         colors = [
             prop
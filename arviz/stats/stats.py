@@ -508,7 +508,7 @@ def loo(data, pointwise=False, reff=None, scale="deviance"):
         if not hasattr(inference_data, "posterior"):
             raise TypeError("Must be able to extract a posterior group from data.")
         posterior = inference_data.posterior
-        n_chains = len(posterior.chain)
+        n_chains = posterior.sizes["chain"]
         if n_chains == 1:
             reff = 1.0
         else:
@@ -1311,7 +1311,7 @@ def loo_pit(idata=None, *, y=None, y_hat=None, log_weights=None):
         if log_weights is None:
             log_likelihood = idata.sample_stats.log_likelihood.stack(sample=("chain", "draw"))
             posterior = convert_to_dataset(idata, group="posterior")
-            n_chains = len(posterior.chain)
+            n_chains = posterior.sizes["chain"]
             n_samples = len(log_likelihood.sample)
             ess_p = ess(posterior, method="mean")
             # this mean is over all data variables
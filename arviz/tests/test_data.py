@@ -1,6 +1,7 @@
 # pylint: disable=no-member, invalid-name, redefined-outer-name
 # pylint: disable=too-many-lines
 from collections import namedtuple
+from types import ModuleType
 import os
 from typing import Dict
 from urllib.parse import urlunsplit
@@ -21,7 +22,13 @@ from arviz import (
     clear_data_home,
     InferenceData,
 )
-from ..data.base import generate_dims_coords, make_attrs
+from ..data.base import (
+    dict_to_dataset,
+    generate_dims_coords,
+    make_attrs,
+    numpy_to_data_array,
+    requires,
+)
 from ..data.datasets import REMOTE_DATASETS, LOCAL_DATASETS, RemoteFileMetadata
 from .helpers import (  # pylint: disable=unused-import
     chains,
@@ -151,6 +158,34 @@ def test_dims_coords_extra_dims():
     assert len(coords["xy"]) == 20
 
 
+def test_dims_coords_inputs_not_modified():
+    shape = 4, 20
+    var_name = "x"
+    in_dims = ["xx"]
+    in_coords = {"xx": np.arange(4), "yy": np.arange(3)}
+    dims, coords = generate_dims_coords(shape, var_name, dims=in_dims, coords=in_coords)
+    assert dims == ["xx", "x_dim_1"]
+    assert set(coords) == {"xx", "x_dim_1"}
+    assert in_dims == ["xx"]
+    assert set(in_coords) == {"xx", "yy"}
+
+
+def test_requires():
+    class Converter:
+        def __init__(self, posterior=None, prior=None):
+            self.posterior = posterior
+            self.prior = prior
+
+        @requires("posterior")
+        @requires(["prior", "missing"])
+        def to_group(self):
+            return "group"
+
+    assert Converter(posterior=1, prior=1).to_group() == "group"
+    assert Converter(posterior=1).to_group() is None
+    assert Converter(prior=1).to_group() is None
+
+
 def test_make_attrs():
     extra_attrs = {"key": "Value"}
     attrs = make_attrs(attrs=extra_attrs)
@@ -158,6 +193,23 @@ def test_make_attrs():
     assert attrs["key"] == "Value"
 
 
+def test_make_attrs_library_version():
+    attrs = make_attrs(library=np)
+    assert attrs["inference_library"] == "numpy"
+    assert attrs["inference_library_version"] == np.__version__
+
+    not_installed = ModuleType("arviz_not_installed_library")
+    not_installed.__version__ = "1.2.3"
+    attrs = make_attrs(library=not_installed)
+    assert attrs["inference_library_version"] == "1.2.3"
+    not_installed.__version__ = [1, 2, 3]
+    attrs = make_attrs(library=not_installed)
+    assert attrs["inference_library_version"] == [1, 2, 3]
+    del not_installed.__version__
+    attrs = make_attrs(library=not_installed)
+    assert "inference_library_version" not in attrs
+
+
 def test_addition():
     idata1 = from_dict(
         posterior={"A": np.random.randn(2, 10, 2), "B": np.random.randn(2, 10, 5, 2)}
@@ -526,6 +578,49 @@ def test_dict_to_dataset():
     assert set(dataset.b.coords) == {"chain", "draw", "c"}
 
 
+def test_dict_to_dataset_shared_dims():
+    datadict = {"a": np.random.randn(4, 100, 3), "b": np.random.randn(4, 100, 3, 2)}
+    dataset = dict_to_dataset(datadict, coords={"c": list("xyz")}, dims={"a": ["c"], "b": ["c"]})
+    assert set(dataset.coords) == {"chain", "draw", "c", "b_dim_1"}
+    assert dataset.a.dims == ("chain", "draw", "c")
+    assert dataset.b.dims == ("chain", "draw", "c", "b_dim_1")
+    assert list(dataset.c.values) == list("xyz")
+
+    # same dim name with different lengths has to be aligned
+    datadict = {"a": np.random.randn(4, 100, 3), "b": np.random.randn(4, 100, 5)}
+    dataset = dict_to_dataset(datadict, dims={"a": ["c"], "b": ["c"]})
+    assert dataset.dims["c"] == 5
+    assert np.isnan(dataset.a.values[..., 3:]).all()
+
+    # variable named like a dim of another variable, same result as converting one by one
+    datadict = {"a": np.random.randn(4, 100, 3), "a_dim_0": np.random.randn(4, 100)}
+    dataset = dict_to_dataset(datadict)
+    expected = xr.Dataset(
+        {key: numpy_to_data_array(values, var_name=key) for key, values in datadict.items()}
+    )
+    assert dataset.equals(expected)
+
+
+def test_dict_to_dataset_1d():
+    datadict = {"a": np.random.randn(100), "b": np.random.randn(100)}
+    dataset = dict_to_dataset(datadict)
+    assert set(dataset.coords) == {"chain", "draw"}
+    assert dataset.a.shape == (1, 100)
+    assert dataset.b.dims == ("chain", "draw")
+
+
+def test_dict_to_dataset_no_copy():
+    """1d and (chain, draw, *shape) arrays are wrapped without copying them."""
+    datadict = {"a": np.random.randn(100)}
+    dataset = dict_to_dataset(datadict)
+    assert np.shares_memory(dataset.a.values, datadict["a"])
+
+    datadict = {"a": np.random.randn(4, 100), "b": np.random.randn(4, 100, 3)}
+    dataset = dict_to_dataset(datadict)
+    assert np.shares_memory(dataset.a.values, datadict["a"])
+    assert np.shares_memory(dataset.b.values, datadict["b"])
+
+
 def test_convert_to_dataset_idempotent():
     first = convert_to_dataset(np.random.randn(100))
     second = convert_to_dataset(first)
@@ -719,6 +719,16 @@ def test_plot_compare_manual(models):
     assert axes
 
 
+def test_plot_compare_not_inplace(models):
+    """Check comp_df is not reordered in place"""
+    model_compare = compare({"Model 1": models.model_1, "Model 2": models.model_2})
+    model_compare = model_compare.iloc[::-1]
+    index = list(model_compare.index)
+    axes = plot_compare(model_compare)
+    assert axes
+    assert list(model_compare.index) == index
+
+
 def test_plot_compare_no_ic(models):
     """Check exception is raised if model_compare doesn't contain a valid information criterion"""
     model_compare = compare({"Model 1": models.model_1, "Model 2": models.model_2})